@@ -1,32 +1,163 @@
 # faculty_wear.py
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request
 from werkzeug.utils import secure_filename
 from bson import ObjectId
-from datetime import datetime
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
+from datetime import datetime, timezone
 import os
+import re
+import math
+import atexit
+import tempfile
+import threading
+import logging
+import logging.handlers
+import queue
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+import cloudinary.utils
+import urllib3
+import orjson
 from functools import wraps
+from operator import itemgetter
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 
 faculty_wear_bp = Blueprint('faculty_wear', __name__, url_prefix='/api/faculty-wear')
 
-# Cloudinary configuration (you can also set these in your app config)
-cloudinary.config(
-    cloud_name=os.getenv('CLOUDINARY_CLOUD_NAME'),
-    api_key=os.getenv('CLOUDINARY_API_KEY'),
-    api_secret=os.getenv('CLOUDINARY_API_SECRET'),
-    secure=True
+# Log records are handed to a listener thread that does the stream write, so
+# callers don't block on stderr I/O. Formatting (including traceback text)
+# still happens on the calling thread, in QueueHandler.prepare().
+# Threads don't survive fork (e.g. gunicorn --preload), so every process
+# starts its own listener, with a fresh queue, via _ensure_log_listener().
+# The queue handler is only attached once a listener is running; until then
+# records go through normal propagation like any other logger's. Records
+# also propagate to whatever handlers the app sets up on the root logger.
+logger = logging.getLogger('faculty_wear')
+_log_handler = logging.handlers.QueueHandler(queue.Queue(-1))
+_log_listener = None
+_log_listener_pid = None
+
+def _ensure_log_listener():
+    global _log_listener, _log_listener_pid
+    if _log_listener_pid == os.getpid():
+        return
+    _log_handler.queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(
+        '%(asctime)s [%(process)d] %(levelname)s %(name)s: %(message)s'
+    ))
+    _log_listener = logging.handlers.QueueListener(_log_handler.queue, stream_handler)
+    _log_listener.start()
+    _log_listener_pid = os.getpid()
+    if _log_handler not in logger.handlers:
+        logger.addHandler(_log_handler)
+
+def _stop_log_listener():
+    # Flushes anything still queued; skipped in a child that never started one
+    if _log_listener is not None and _log_listener_pid == os.getpid():
+        _log_listener.stop()
+
+def _restart_log_listener_after_fork():
+    if _log_listener is not None:
+        _ensure_log_listener()
+
+atexit.register(_stop_log_listener)
+os.register_at_fork(after_in_child=_restart_log_listener_after_fork)
+
+# Cloudinary credentials, read once. They are applied lazily by
+# _ensure_cloudinary() rather than at import time.
+_CLOUD_CFG = (
+    os.getenv('CLOUDINARY_CLOUD_NAME'),
+    os.getenv('CLOUDINARY_API_KEY'),
+    os.getenv('CLOUDINARY_API_SECRET'),
+)
+_cloudinary_configured = False
+
+def _ensure_cloudinary():
+    global _cloudinary_configured
+    if _cloudinary_configured:
+        return
+    cloud_name, api_key, api_secret = _CLOUD_CFG
+    cloudinary.config(
+        cloud_name=cloud_name,
+        api_key=api_key,
+        api_secret=api_secret,
+        secure=True
+    )
+    _cloudinary_configured = True
+
+# Cloudinary uploads and deletes run in background pools so requests don't
+# wait on them. Image uploads get their own pool so a backlog of slow
+# uploads can't hold up clean-up of replaced/deleted images.
+_MEDIA_WORKERS = 4
+_CLEANUP_WORKERS = 2
+_media_executor = ThreadPoolExecutor(max_workers=_MEDIA_WORKERS,
+                                     thread_name_prefix='faculty-wear-media')
+_cleanup_executor = ThreadPoolExecutor(max_workers=_CLEANUP_WORKERS,
+                                       thread_name_prefix='faculty-wear-cleanup')
+
+# The SDK's module-level connector keeps only one connection per host, so
+# concurrent calls from the background pool each paid a fresh TCP+TLS
+# handshake. Swap in a process-wide pool sized for them (it is shared with
+# the other blueprints' Cloudinary calls too).
+cloudinary.uploader._http = cloudinary.utils.get_http_connector(
+    cloudinary.config(),
+    dict(cloudinary.CERT_KWARGS,
+         maxsize=(_MEDIA_WORKERS + _CLEANUP_WORKERS) * 2,
+         block=False,
+         retries=urllib3.Retry(3))
 )
 
+# Serialised list responses keyed on (page, limit, search), cleared whenever
+# a wear is created, updated or deleted. The generation is bumped on every
+# clear so a list read that started before a write can't store its (stale)
+# body afterwards.
+_LIST_CACHE = TTLCache(maxsize=512, ttl=60)
+_cache_lock = threading.Lock()
+_cache_generation = 0
+
+def invalidate_list_cache():
+    global _cache_generation
+    with _cache_lock:
+        _cache_generation += 1
+        _LIST_CACHE.clear()
+
 # Helper functions
+def _dumps(payload):
+    # ObjectIds go through default=str; datetimes are serialised natively
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NAIVE_UTC)
+
+def _json(payload, status=200):
+    return Response(_dumps(payload), status=status, mimetype='application/json')
+
+_ALLOWED_EXT_RE = re.compile(r'\.(?:png|jpe?g|gif|webp)\Z', re.IGNORECASE)
+
 def allowed_file(filename):
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return bool(_ALLOWED_EXT_RE.search(filename or ''))
+
+def get_search_fields(data):
+    """Lowercased copies of the prefix-searchable fields, stored alongside them"""
+    return {
+        'title_lc': data.get('title', '').lower(),
+        'badge_text_lc': data.get('badge_text', '').lower()
+    }
+
+def _parse_number(value, cast):
+    try:
+        number = cast(value)
+    except (TypeError, ValueError):
+        return None
+    # float() accepts 'nan' and 'inf', neither of which is a usable price
+    return number if math.isfinite(number) else None
 
 def validate_faculty_wear_data(data, require_image=False):
+    """Validate form data, returning (errors, parsed numeric fields)"""
     errors = []
+    parsed = {'standard_price': None, 'custom_price': None, 'order': None}
     
     if not data.get('title'):
         errors.append('Title is required')
@@ -36,119 +167,271 @@ def validate_faculty_wear_data(data, require_image=False):
     
     if not data.get('standard_price'):
         errors.append('Standard price is required')
-    elif float(data.get('standard_price', 0)) <= 0:
-        errors.append('Standard price must be greater than 0')
+    else:
+        standard_price = _parse_number(data['standard_price'], float)
+        if standard_price is None:
+            errors.append('Standard price must be a number')
+        elif standard_price <= 0:
+            errors.append('Standard price must be greater than 0')
+        parsed['standard_price'] = standard_price
     
-    if data.get('custom_price') and float(data.get('custom_price', 0)) <= 0:
-        errors.append('Custom price must be greater than 0')
+    if data.get('custom_price'):
+        custom_price = _parse_number(data['custom_price'], float)
+        if custom_price is None:
+            errors.append('Custom price must be a number')
+        elif custom_price <= 0:
+            errors.append('Custom price must be greater than 0')
+        parsed['custom_price'] = custom_price
     
     if not data.get('order'):
         errors.append('Display order is required')
-    elif int(data.get('order', 0)) < 1:
-        errors.append('Display order must be at least 1')
+    else:
+        order = _parse_number(data['order'], int)
+        if order is None:
+            errors.append('Display order must be a whole number')
+        elif order < 1:
+            errors.append('Display order must be at least 1')
+        parsed['order'] = order
     
-    return errors
+    return errors, parsed
+
+def save_upload_to_tmp(file):
+    """Save an uploaded file to disk so it outlives the request"""
+    suffix = os.path.splitext(secure_filename(file.filename))[1]
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    file.save(tmp_path)
+    return tmp_path
 
 def upload_to_cloudinary(file, folder="faculty_wears"):
-    if not file or not allowed_file(file.filename):
+    if not file:
         return None
     
+    _ensure_cloudinary()
     try:
-        upload_result = cloudinary.uploader.upload(
+        # Sent in chunks so large images are never held in memory whole
+        upload_result = cloudinary.uploader.upload_large(
             file,
             folder=folder,
-            resource_type="auto",
+            chunk_size=6 * 1024 * 1024,
+            resource_type="image",
             quality="auto:good",
             width=800,
             crop="limit"
         )
         return upload_result.get('secure_url')
-    except Exception as e:
-        print(f"Cloudinary upload error: {str(e)}")
+    except Exception:
+        logger.exception('Cloudinary upload failed')
         return None
 
+def get_cloudinary_public_id(image_url):
+    """Extract the public_id (including folders) from a Cloudinary URL"""
+    # /<cloud_name>/<resource_type>/upload/[v<version>/]<folders...>/<name>.<ext>
+    segments = urlparse(image_url).path.split('/')[4:]
+    if segments and segments[0][:1] == 'v' and segments[0][1:].isdigit():
+        segments = segments[1:]
+    segments[-1] = segments[-1].rsplit('.', 1)[0]
+    return '/'.join(segments)
+
 def delete_from_cloudinary(image_url):
+    _ensure_cloudinary()
     try:
-        # Extract public_id from URL
-        public_id = image_url.split('/')[-1].split('.')[0]
-        if '/' in image_url:
-            # Get the full path with folder
-            parts = image_url.split('/')
-            folder = parts[-2]
-            public_id = f"{folder}/{public_id}"
-        
+        public_id = get_cloudinary_public_id(image_url)
         result = cloudinary.uploader.destroy(public_id)
         return result.get('result') == 'ok'
-    except Exception as e:
-        print(f"Cloudinary delete error: {str(e)}")
+    except Exception:
+        logger.exception('Cloudinary delete failed')
         return False
 
+def submit_image_task(tmp_path, task, *args):
+    """Hand tmp_path over to a background task, removing it if that fails"""
+    try:
+        _media_executor.submit(task, *args)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+def upload_faculty_image(db, wear_oid, upload_id, tmp_path):
+    """Background task: upload a saved image and attach it to the wear
+    
+    The wear is only updated while its image_upload_id still matches
+    upload_id, so an upload that was superseded by a newer one (or whose
+    wear was deleted meanwhile) never overwrites the current image. Until
+    then the wear keeps its previous image (none, for a new wear) and
+    status 'processing'; a failed upload sets status 'failed'. If a worker
+    is lost mid-upload the wear stays 'processing' until the next image
+    update replaces the stale upload_id.
+    """
+    try:
+        image_url = upload_to_cloudinary(tmp_path)
+    finally:
+        os.remove(tmp_path)
+    
+    current = {'_id': wear_oid, 'image_upload_id': upload_id}
+    try:
+        if not image_url:
+            db.faculty_wear.update_one(
+                current,
+                {'$set': {'status': 'failed'}, '$unset': {'image_upload_id': ''}}
+            )
+            invalidate_list_cache()
+            return
+        
+        previous = db.faculty_wear.find_one_and_update(
+            current,
+            {'$set': {'image_url': image_url, 'status': 'ready'},
+             '$unset': {'image_upload_id': ''}},
+            projection={'image_url': 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        invalidate_list_cache()
+    except Exception:
+        # Whether the update applied is unknown, so leave both images alone
+        logger.exception('Faculty wear image task failed')
+        return
+    
+    # Drop whichever image is no longer referenced: the one just replaced,
+    # or the new upload itself if it didn't get attached. Done on the
+    # clean-up pool so this worker (and the cache refresh) doesn't wait.
+    if previous is None:
+        stale_url = image_url
+    else:
+        stale_url = previous.get('image_url')
+    if stale_url:
+        _cleanup_executor.submit(delete_from_cloudinary, stale_url)
+
+# (field, default) pairs copied as-is from the document into responses, in
+# response order (after 'id')
+_RESPONSE_FIELDS = (
+    ('title', None),
+    ('description', None),
+    ('image_url', ''),
+    ('badge_text', ''),
+    ('standard_price', None),
+    ('custom_price', None),
+    ('add_to_cart_text', 'Add to Cart'),
+    ('add_to_cart_link', ''),
+    ('buy_now_text', 'Buy Now'),
+    ('buy_now_link', ''),
+    ('order', 1),
+    ('status', 'ready'),
+    ('created_at', None),
+    ('updated_at', None),
+)
+
+# Only fetch what get_faculty_wear_response reads
+_WEAR_PROJECTION = {field: 1 for field, _ in _RESPONSE_FIELDS}
+
+_RESPONSE_DEFAULTS = dict(_RESPONSE_FIELDS)
+_RESPONSE_KEYS = ('id',) + tuple(field for field, _ in _RESPONSE_FIELDS)
+_get_response_values = itemgetter('_id', *(field for field, _ in _RESPONSE_FIELDS))
+
 def get_faculty_wear_response(wear):
-    return {
-        'id': str(wear['_id']),
-        'title': wear['title'],
-        'description': wear['description'],
-        'image_url': wear.get('image_url', ''),
-        'badge_text': wear.get('badge_text', ''),
-        'standard_price': wear['standard_price'],
-        'custom_price': wear.get('custom_price'),
-        'add_to_cart_text': wear.get('add_to_cart_text', 'Add to Cart'),
-        'add_to_cart_link': wear.get('add_to_cart_link', ''),
-        'buy_now_text': wear.get('buy_now_text', 'Buy Now'),
-        'buy_now_link': wear.get('buy_now_link', ''),
-        'order': wear.get('order', 1),
-        'created_at': wear.get('created_at', datetime.now()).isoformat(),
-        'updated_at': wear.get('updated_at', datetime.now()).isoformat()
-    }
+    # Defaults are filled by one C-level dict merge and all values pulled by a
+    # single itemgetter call, instead of a .get() per field
+    return dict(zip(_RESPONSE_KEYS, _get_response_values({**_RESPONSE_DEFAULTS, **wear})))
+
+# New wears have image_url '' until their first upload is attached (or if it
+# failed). They can be fetched by id to poll their status, but are left out
+# of the list.
+_LISTED = {'image_url': {'$gt': ''}}
+_UNLISTED = {'image_url': ''}
 
 # Routes
 @faculty_wear_bp.route('/', methods=['GET'])
 def get_all_wears():
     try:
         db = request.app.config['db']
-        page = int(request.args.get('page', 1))
-        limit = int(request.args.get('limit', 5))
+        page = _parse_number(request.args.get('page', 1), int)
+        limit = _parse_number(request.args.get('limit', 5), int)
         search = request.args.get('search', '').strip()
         
-        query = {}
-        if search:
-            query['$or'] = [
-                {'title': {'$regex': search, '$options': 'i'}},
-                {'description': {'$regex': search, '$options': 'i'}},
-                {'badge_text': {'$regex': search, '$options': 'i'}}
-            ]
+        if page is None or page < 1:
+            return _json({'success': False, 'error': 'page must be a whole number of at least 1'}, 400)
+        if limit is None or limit < 1:
+            return _json({'success': False, 'error': 'limit must be a whole number of at least 1'}, 400)
         
-        total = db.faculty_wear.count_documents(query)
-        wears = list(db.faculty_wear.find(query)
-                    .sort('order', 1)
-                    .skip((page - 1) * limit)
-                    .limit(limit))
+        key = (page, limit, search)
+        with _cache_lock:
+            cached = _LIST_CACHE.get(key)
+            generation = _cache_generation
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
         
-        return jsonify({
+        if not search:
+            # Unfiltered: the total comes from collection metadata, minus the
+            # few unlisted wears (counted off the small fw_unlisted index)
+            total = max(db.faculty_wear.estimated_document_count()
+                        - db.faculty_wear.count_documents(_UNLISTED), 0)
+            wears = list(db.faculty_wear.find(_LISTED, _WEAR_PROJECTION, batch_size=limit)
+                        .sort([('order', 1), ('_id', 1)])
+                        .skip((page - 1) * limit)
+                        .limit(limit))
+        else:
+            # $text matches whole words only, so also match titles/badges that
+            # start with the search term. The regex runs against the lowercased
+            # copies and is anchored, so Mongo can turn it into an index range
+            # scan while the match stays case-insensitive.
+            pattern = '^' + re.escape(search.lower())
+            query = {'$or': [
+                {'$text': {'$search': search}},
+                {'title_lc': {'$regex': pattern}},
+                {'badge_text_lc': {'$regex': pattern}}
+            ]}
+            query.update(_LISTED)
+            
+            # Page and total in one round-trip. A text/regex $or can't take its
+            # order from the order_id index, so the page is sorted inside the
+            # data branch, where Mongo coalesces $sort/$skip/$limit into a
+            # bounded top-k sort instead of sorting every match.
+            page_stages = [
+                {'$sort': {'order': 1, '_id': 1}},
+                {'$skip': (page - 1) * limit},
+                {'$limit': limit},
+                {'$project': _WEAR_PROJECTION}
+            ]
+            pipeline = [
+                {'$match': query},
+                {'$facet': {
+                    'data': page_stages,
+                    'meta': [{'$count': 'total'}]
+                }}
+            ]
+            result = next(db.faculty_wear.aggregate(pipeline, allowDiskUse=False))
+            wears = result['data']
+            total = result['meta'][0]['total'] if result['meta'] else 0
+        
+        payload = {
             'success': True,
             'data': [get_faculty_wear_response(wear) for wear in wears],
             'total': total,
             'page': page,
             'limit': limit
-        })
+        }
+        body = _dumps(payload)
+        with _cache_lock:
+            if generation == _cache_generation:
+                _LIST_CACHE[key] = body
+        
+        return Response(body, mimetype='application/json')
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json({'success': False, 'error': str(e)}, 500)
 
 @faculty_wear_bp.route('/<wear_id>', methods=['GET'])
 def get_wear(wear_id):
     try:
         db = request.app.config['db']
-        wear = db.faculty_wear.find_one({'_id': ObjectId(wear_id)})
+        wear = db.faculty_wear.find_one({'_id': ObjectId(wear_id)}, _WEAR_PROJECTION)
         
         if not wear:
-            return jsonify({'success': False, 'error': 'Wear not found'}), 404
+            return _json({'success': False, 'error': 'Wear not found'}, 404)
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': get_faculty_wear_response(wear)
         })
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json({'success': False, 'error': str(e)}, 500)
 
 @faculty_wear_bp.route('/', methods=['POST'])
 def create_wear():
@@ -157,141 +440,168 @@ def create_wear():
         
         # Handle form data
         form_data = request.form.to_dict()
-        errors = validate_faculty_wear_data(form_data, require_image=True)
+        errors, parsed = validate_faculty_wear_data(form_data, require_image=True)
         
         if errors:
-            return jsonify({'success': False, 'error': 'Validation failed', 'details': errors}), 400
+            return _json({'success': False, 'error': 'Validation failed', 'details': errors}, 400)
         
         # Handle file upload
         image_file = request.files.get('image')
         if not image_file:
-            return jsonify({'success': False, 'error': 'Image is required'}), 400
+            return _json({'success': False, 'error': 'Image is required'}, 400)
+        if not allowed_file(image_file.filename):
+            return _json({'success': False, 'error': 'Invalid image file type'}, 400)
         
-        image_url = upload_to_cloudinary(image_file)
-        if not image_url:
-            return jsonify({'success': False, 'error': 'Failed to upload image'}), 400
+        now = datetime.now(timezone.utc)
         
-        # Prepare wear data
+        # Prepare wear data; image_url is filled in once the upload finishes
+        upload_id = ObjectId()
         wear_data = {
             'title': form_data['title'],
             'description': form_data['description'],
-            'image_url': image_url,
+            'image_url': '',
+            'status': 'processing',
+            'image_upload_id': upload_id,
             'badge_text': form_data.get('badge_text', ''),
-            'standard_price': float(form_data['standard_price']),
-            'custom_price': float(form_data['custom_price']) if form_data.get('custom_price') else None,
+            'standard_price': parsed['standard_price'],
+            'custom_price': parsed['custom_price'],
             'add_to_cart_text': form_data.get('add_to_cart_text', 'Add to Cart'),
             'add_to_cart_link': form_data.get('add_to_cart_link', ''),
             'buy_now_text': form_data.get('buy_now_text', 'Buy Now'),
             'buy_now_link': form_data.get('buy_now_link', ''),
-            'order': int(form_data.get('order', 1)),
-            'created_at': datetime.now(),
-            'updated_at': datetime.now()
+            'order': parsed['order'],
+            'created_at': now,
+            'updated_at': now
         }
+        wear_data.update(get_search_fields(wear_data))
+        
+        tmp_path = save_upload_to_tmp(image_file)
         
         # Insert into database
-        result = db.faculty_wear.insert_one(wear_data)
+        try:
+            result = db.faculty_wear.insert_one(wear_data)
+        except Exception:
+            os.remove(tmp_path)
+            raise
         wear_data['_id'] = result.inserted_id
         
-        return jsonify({
+        submit_image_task(tmp_path, upload_faculty_image, db, result.inserted_id, upload_id, tmp_path)
+        
+        return _json({
             'success': True,
             'data': get_faculty_wear_response(wear_data),
-            'message': 'Faculty wear created successfully'
-        }), 201
+            'message': 'Faculty wear created, image is processing'
+        }, 202)
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json({'success': False, 'error': str(e)}, 500)
 
 @faculty_wear_bp.route('/<wear_id>', methods=['PUT'])
 def update_wear(wear_id):
     try:
         db = request.app.config['db']
-        
-        # Check if wear exists
-        existing_wear = db.faculty_wear.find_one({'_id': ObjectId(wear_id)})
-        if not existing_wear:
-            return jsonify({'success': False, 'error': 'Wear not found'}), 404
+        oid = ObjectId(wear_id)
         
         # Handle form data
         form_data = request.form.to_dict()
-        errors = validate_faculty_wear_data(form_data, require_image=False)
+        errors, parsed = validate_faculty_wear_data(form_data, require_image=False)
         
         if errors:
-            return jsonify({'success': False, 'error': 'Validation failed', 'details': errors}), 400
+            return _json({'success': False, 'error': 'Validation failed', 'details': errors}, 400)
         
         # Handle file upload if new image is provided
         image_file = request.files.get('image')
-        image_url = None
+        tmp_path = None
         
         if image_file:
-            # First upload new image
-            image_url = upload_to_cloudinary(image_file)
-            if not image_url:
-                return jsonify({'success': False, 'error': 'Failed to upload image'}), 400
-            
-            # Then delete old image from Cloudinary
-            if existing_wear.get('image_url'):
-                delete_from_cloudinary(existing_wear['image_url'])
+            if not allowed_file(image_file.filename):
+                return _json({'success': False, 'error': 'Invalid image file type'}, 400)
+            tmp_path = save_upload_to_tmp(image_file)
         
         # Prepare update data
         update_data = {
             'title': form_data['title'],
             'description': form_data['description'],
             'badge_text': form_data.get('badge_text', ''),
-            'standard_price': float(form_data['standard_price']),
-            'custom_price': float(form_data['custom_price']) if form_data.get('custom_price') else None,
+            'standard_price': parsed['standard_price'],
+            'custom_price': parsed['custom_price'],
             'add_to_cart_text': form_data.get('add_to_cart_text', 'Add to Cart'),
             'add_to_cart_link': form_data.get('add_to_cart_link', ''),
             'buy_now_text': form_data.get('buy_now_text', 'Buy Now'),
             'buy_now_link': form_data.get('buy_now_link', ''),
-            'order': int(form_data.get('order', 1)),
-            'updated_at': datetime.now()
+            'order': parsed['order'],
+            'updated_at': datetime.now(timezone.utc)
         }
+        update_data.update(get_search_fields(update_data))
         
-        if image_url:
-            update_data['image_url'] = image_url
+        upload_id = None
+        if tmp_path:
+            # Marks this upload as the current one; older in-flight uploads
+            # for the same wear will no longer match and discard themselves
+            upload_id = ObjectId()
+            update_data['status'] = 'processing'
+            update_data['image_upload_id'] = upload_id
         
-        # Update in database
-        db.faculty_wear.update_one(
-            {'_id': ObjectId(wear_id)},
-            {'$set': update_data}
-        )
+        # Update in database, getting the previous version back in the same
+        # round-trip (it doubles as the existence check)
+        try:
+            existing_wear = db.faculty_wear.find_one_and_update(
+                {'_id': oid},
+                {'$set': update_data},
+                return_document=ReturnDocument.BEFORE
+            )
+        except Exception:
+            if tmp_path:
+                os.remove(tmp_path)
+            raise
+        if not existing_wear:
+            if tmp_path:
+                os.remove(tmp_path)
+            return _json({'success': False, 'error': 'Wear not found'}, 404)
+        invalidate_list_cache()
+        
+        updated_wear = {**existing_wear, **update_data}
         
-        # Get updated wear
-        updated_wear = db.faculty_wear.find_one({'_id': ObjectId(wear_id)})
+        if tmp_path:
+            # The old image is replaced once the new upload finishes
+            submit_image_task(tmp_path, upload_faculty_image, db, oid, upload_id, tmp_path)
+            return _json({
+                'success': True,
+                'data': get_faculty_wear_response(updated_wear),
+                'message': 'Faculty wear updated, image is processing'
+            }, 202)
         
-        return jsonify({
+        return _json({
             'success': True,
             'data': get_faculty_wear_response(updated_wear),
             'message': 'Faculty wear updated successfully'
         })
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json({'success': False, 'error': str(e)}, 500)
 
 @faculty_wear_bp.route('/<wear_id>', methods=['DELETE'])
 def delete_wear(wear_id):
     try:
         db = request.app.config['db']
         
-        # Check if wear exists
-        wear = db.faculty_wear.find_one({'_id': ObjectId(wear_id)})
+        # Delete wear from database, keeping its image_url for cleanup
+        wear = db.faculty_wear.find_one_and_delete(
+            {'_id': ObjectId(wear_id)},
+            projection={'image_url': 1}
+        )
         if not wear:
-            return jsonify({'success': False, 'error': 'Wear not found'}), 404
+            return _json({'success': False, 'error': 'Wear not found'}, 404)
+        invalidate_list_cache()
         
-        # Delete image from Cloudinary if exists
+        # Delete image from Cloudinary in the background
         if wear.get('image_url'):
-            delete_from_cloudinary(wear['image_url'])
-        
-        # Delete wear from database
-        result = db.faculty_wear.delete_one({'_id': ObjectId(wear_id)})
-        
-        if result.deleted_count == 0:
-            return jsonify({'success': False, 'error': 'Failed to delete wear'}), 500
+            _cleanup_executor.submit(delete_from_cloudinary, wear['image_url'])
         
-        return jsonify({
+        return _json({
             'success': True,
             'message': 'Faculty wear deleted successfully'
         })
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json({'success': False, 'error': str(e)}, 500)
 
 def init_faculty_wear_module(app, db):
     """Initialize the faculty wear module with the Flask app"""
@@ -301,11 +611,34 @@ def init_faculty_wear_module(app, db):
     # Configure database
     app.config['db'] = db
     
-    # Initialize Cloudinary (if not already initialized)
-    if not cloudinary.config().cloud_name:
-        cloudinary.config(
-            cloud_name=os.getenv('CLOUDINARY_CLOUD_NAME'),
-            api_key=os.getenv('CLOUDINARY_API_KEY'),
-            api_secret=os.getenv('CLOUDINARY_API_SECRET'),
-            secure=True
-        )
+    # Indexes. Search results are listed by display order, not relevance, so
+    # the text index carries no field weights.
+    text_index = [('title', 'text'), ('description', 'text'), ('badge_text', 'text')]
+    try:
+        db.faculty_wear.create_index(text_index, name='fw_text')
+    except OperationFailure as e:
+        if e.code != 85:  # IndexOptionsConflict: an older, weighted fw_text
+            raise
+        db.faculty_wear.drop_index('fw_text')
+        db.faculty_wear.create_index(text_index, name='fw_text')
+    db.faculty_wear.create_index([('order', 1), ('_id', 1)], name='order_id')
+    db.faculty_wear.create_index([('title_lc', 1)])
+    db.faculty_wear.create_index([('badge_text_lc', 1)])
+    db.faculty_wear.create_index(
+        [('image_url', 1)],
+        partialFilterExpression=_UNLISTED,
+        name='fw_unlisted'
+    )
+    
+    # Backfill lowercased search fields on wears saved before they existed
+    db.faculty_wear.update_many(
+        {'title_lc': {'$exists': False}},
+        [{'$set': {
+            'title_lc': {'$toLower': '$title'},
+            'badge_text_lc': {'$toLower': '$badge_text'}
+        }}]
+    )
+    
+    # Initialize Cloudinary and logging
+    _ensure_cloudinary()
+    _ensure_log_listener()